@@ -1,12 +1,112 @@
 import threading
 import time
-import yaml
 import os
+import re
+import functools
+import types
+from collections import deque
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
+from typing import Deque, Dict, Any, Optional, List, Mapping, Pattern, Tuple
 
 from monmon.types import LogEntry
-from monmon.exceptions import TerminationConditionMet
+from monmon.exceptions import MonitorException, TerminationConditionMet
+
+# Conditions that are evaluated structurally rather than by pattern matching
+LOOP_CONDITION = "agent seems stuck in a loop"
+ACTION_LIMIT_PREFIX = "the number of actions is >"
+
+# Number of most recent log entries retained, unless overridden by `max_logs`
+DEFAULT_MAX_LOGS = 10_000
+
+# Monitoring loop poll interval bounds, in seconds
+MIN_BACKOFF = 0.001
+MAX_BACKOFF = 0.1
+
+
+@functools.lru_cache(maxsize=32)
+def _load_yaml_cached(path: str, mtime: float, size: int) -> Mapping[str, Any]:
+    """
+    Parse a YAML config file, caching the result by path, mtime and size.
+    
+    The mtime and size arguments are only part of the cache key, so that an
+    edited file is parsed again. The result is shared between callers, so it
+    is returned as a read-only mapping with list values frozen into tuples.
+    """
+    import yaml  # Deferred: PyYAML is slow to import and only needed when a config exists
+    
+    with open(path, 'r') as f:
+        data = yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+    if data is None:
+        data = {}
+    if not isinstance(data, dict):
+        raise MonitorException(
+            f"Config file {path} must contain a mapping, got {type(data).__name__}"
+        )
+    return types.MappingProxyType({
+        key: tuple(value) if isinstance(value, list) else value
+        for key, value in data.items()
+    })
+
+
+def _compile_conditions(conditions: List[str]) -> Tuple[Optional[Pattern], Dict[str, str]]:
+    """
+    Compile substring conditions into a single alternation.
+    
+    Conditions are casefolded here, so the pattern must be matched against
+    casefolded text (see the "content_lower" log field). Each condition gets
+    its own named group so that `match.lastgroup` can be mapped back to the
+    original condition string.
+    
+    Returns:
+        The compiled pattern (None if there are no conditions) and a mapping
+        from group name to condition.
+    """
+    group_to_condition = {}
+    alternatives = []
+    for i, condition in enumerate(conditions):
+        group = f"c{i}"
+        group_to_condition[group] = condition
+        alternatives.append(f"(?P<{group}>{re.escape(condition.casefold())})")
+    
+    if not alternatives:
+        return None, group_to_condition
+    return re.compile("|".join(alternatives)), group_to_condition
+
+
+def _bucket_conditions(conditions: List[str]) -> Tuple[List[str], bool, Optional[int], Optional[str]]:
+    """
+    Split termination conditions by how they are evaluated.
+    
+    Returns:
+        A tuple of (substring conditions, whether loop detection is enabled,
+        smallest action limit or None, condition that limit came from or None).
+        Malformed action-count conditions are ignored.
+    """
+    substring_conds = []
+    check_loop = False
+    action_limit, action_limit_cond = None, None
+    for condition in conditions:
+        if condition == LOOP_CONDITION:
+            check_loop = True
+        elif condition.startswith(ACTION_LIMIT_PREFIX):
+            try:
+                limit = int(condition.split(">")[1].strip())
+            except (ValueError, IndexError):
+                continue
+            # Several limits can be configured; the smallest one is binding
+            if action_limit is None or limit < action_limit:
+                action_limit, action_limit_cond = limit, condition
+        else:
+            substring_conds.append(condition)
+    return substring_conds, check_loop, action_limit, action_limit_cond
+
+
+def _parse_max_logs(value: Any) -> int:
+    """Validate the optional `max_logs` config value."""
+    if isinstance(value, bool) or not isinstance(value, int) or value <= 0:
+        raise MonitorException(f"max_logs must be a positive integer, got {value!r}")
+    return value
+
 
 class BaseMonitor(ABC):
     """
@@ -18,35 +118,77 @@ class BaseMonitor(ABC):
         self._termination_flag = threading.Event()
         self._pause_flag = threading.Event()
         self._resume_flag = threading.Event()
+        self._log_seq = 0  # Bumped by log(); plain int reads are atomic under the GIL
+        self._paused = False  # Mirrors _pause_flag; plain reads are atomic under the GIL
         self._permission_granted = None
         
         # Threading
         self._monitoring_thread = None
         self._main_thread_id = threading.main_thread().ident
         
-        # State
-        self._logs: List[LogEntry] = []
-        self._current_permission_condition = None
-        
         # Load configuration
         self._config_path = config_path
         self._conditions = self._load_conditions()
+        self._max_logs = _parse_max_logs(self._conditions.get("max_logs", DEFAULT_MAX_LOGS))
+        
+        # State - only the most recent logs are retained
+        self._logs: Deque[LogEntry] = deque(maxlen=self._max_logs)
+        self._pending_logs: Deque[LogEntry] = deque(maxlen=self._max_logs)  # Not yet scanned
+        self._recent_actions: Deque[str] = deque(maxlen=6)  # Stringified, for loop detection
+        self._assistant_count = 0
+        self._current_permission_condition = None
+        
+        # Conditions bucketed by type, with substring conditions precompiled
+        # into patterns that are scanned once per log
+        (
+            self._substring_conds,
+            self._check_loop,
+            self._action_limit,
+            self._action_limit_cond,
+        ) = _bucket_conditions(list(self._conditions.get("terminate_if") or []))
+        self._terminate_re, self._terminate_groups = _compile_conditions(self._substring_conds)
+        self._permission_re, self._permission_groups = _compile_conditions(
+            list(self._conditions.get("ask_permission_if") or [])
+        )
+        self._has_terminate_conditions = bool(self._conditions.get("terminate_if"))
+        self._has_permission_conditions = bool(self._conditions.get("ask_permission_if"))
+        
+        # Decided by _is_disabled() on each __enter__
+        self._disabled = False
     
-    def _load_conditions(self) -> Dict[str, list]:
+    def _load_conditions(self) -> Mapping[str, Any]:
         """Load monitoring conditions from YAML file."""
         if not os.path.exists(self._config_path):
-            return {"terminate_if": [], "ask_permission_if": []}
+            return {"terminate_if": (), "ask_permission_if": ()}
+        
+        st = os.stat(self._config_path)
+        return _load_yaml_cached(self._config_path, st.st_mtime, st.st_size)
+    
+    def _drain_pending_logs(self) -> List[LogEntry]:
+        """
+        Return the logs appended since the previous call.
         
-        with open(self._config_path, 'r') as f:
-            return yaml.safe_load(f)
+        log() is the only producer and the monitoring thread the only consumer,
+        so the atomic deque append/popleft pair needs no extra locking.
+        """
+        new_logs = []
+        while self._pending_logs:
+            new_logs.append(self._pending_logs.popleft())
+        return new_logs
     
     def __enter__(self):
         """Context manager entry point."""
         # Clear any previous state
         self._pause_flag.clear()
+        self._paused = False
         self._resume_flag.clear()
         self._termination_flag.clear()
         
+        # With nothing to check, skip the monitoring thread entirely
+        self._disabled = self._is_disabled()
+        if self._disabled:
+            return self
+        
         # Start monitoring thread
         self._monitoring_thread = threading.Thread(target=self._monitor_loop)
         self._monitoring_thread.daemon = True
@@ -72,16 +214,25 @@ class BaseMonitor(ABC):
             role: The role of the entity generating the content (e.g., "assistant", "user")
             content: The content being logged (can be any type)
         """
+        log_entry = LogEntry(role=role, content=content, timestamp_ns=time.monotonic_ns())
+        if self._disabled:
+            # Nothing will inspect the entry, so skip stringifying it
+            self._logs.append(log_entry)
+            return
+        
+        # Stringify and casefold once here rather than on every check in the monitoring thread
+        log_entry.content_lower  # Also computes content_str
+        
         # Add to logs
-        log_entry: LogEntry = {
-            "role": role, 
-            "content": content, 
-            "timestamp": time.time()
-        }
         self._logs.append(log_entry)
+        self._pending_logs.append(log_entry)
+        if role == "assistant":
+            self._recent_actions.append(log_entry.content_str)
+            self._assistant_count += 1
+        self._log_seq += 1  # Signal the monitoring thread
         
         # Check if we're currently paused - if so, wait for resume
-        if self._pause_flag.is_set():
+        if self._paused:
             print(f"Agent paused: Waiting for permission...")
             self._resume_flag.wait()  # Block until resumed
             
@@ -93,16 +244,40 @@ class BaseMonitor(ABC):
     
     def _monitor_loop(self):
         """Main monitoring loop that runs in background thread."""
+        last_seq = 0
+        # Permission checks track the sequence separately: a log that arrives
+        # while paused is checked once permission is granted
+        last_permission_seq = 0
+        backoff = MIN_BACKOFF
         while not self._termination_flag.is_set():
+            # Poll the log sequence number, backing off exponentially while idle
+            seq = self._log_seq
+            permission_pending = not self._paused and seq != last_permission_seq
+            if seq == last_seq and not permission_pending:
+                time.sleep(backoff)
+                backoff = min(backoff * 2, MAX_BACKOFF)
+                continue
+            backoff = MIN_BACKOFF
+            
             # First check termination conditions
-            self._check_termination_conditions()
+            if seq != last_seq:
+                last_seq = seq
+                self._check_termination_conditions()
             
             # Then check permission conditions if not already paused
-            if not self._pause_flag.is_set():
+            if permission_pending:
+                last_permission_seq = seq
                 self._check_permission_conditions()
-            
-            # Sleep to avoid CPU spinning
-            time.sleep(0.1)
+    
+    def _is_disabled(self) -> bool:
+        """
+        Whether monitoring can be skipped entirely for the next `with` block.
+        
+        When this returns True, no monitoring thread is started and log() only
+        records entries. Override in monitors that can tell they have nothing
+        to check; the default keeps monitoring enabled.
+        """
+        return False
     
     @abstractmethod
     def _check_termination_conditions(self):
@@ -143,8 +318,9 @@ class BaseMonitor(ABC):
             condition: The condition that triggered the permission request
         """
         self._current_permission_condition = condition
-        self._pause_flag.set()
         self._resume_flag.clear()
+        self._pause_flag.set()
+        self._paused = True
         
         # Notify listeners (UI, etc) that permission is needed
         self._notify_permission_needed(condition)
@@ -159,6 +335,7 @@ class BaseMonitor(ABC):
         self._permission_granted = granted
         self._resume_flag.set()  # Signal main thread to continue
         self._pause_flag.clear()  # Clear the pause flag
+        self._paused = False
     
     def _notify_permission_needed(self, condition: str):
         """
@@ -1,64 +1,71 @@
-from monmon.base import BaseMonitor
+import bisect
+
+from monmon.base import BaseMonitor, LOOP_CONDITION
 from monmon.exceptions import TerminationConditionMet
 
+LOG_SEPARATOR = "\x00"
+
 class LocalMonitor(BaseMonitor):
     """
     A simple monitor implementation that uses pattern matching.
     
     This monitor:
-    - Uses simple string pattern matching to detect conditions
+    - Uses precompiled case-insensitive patterns to detect conditions
     - Implements basic loop detection
     - Tracks action counts
     
     For more sophisticated monitoring, consider using other monitor implementations.
     """
+    def _is_disabled(self):
+        """Monitoring is a no-op when no conditions are configured."""
+        return not (self._has_terminate_conditions or self._has_permission_conditions)
+    
     def _check_termination_conditions(self):
         """Check if any termination conditions are met using pattern matching."""
-        if not self._logs:
+        if not self._has_terminate_conditions or not self._logs:
             return
         
-        # Simple implementation - could be much more sophisticated
-        for condition in self._conditions.get("terminate_if", []):
-            # Check last few log entries
-            recent_logs = self._logs[-10:]
-            for log in recent_logs:
-                log_str = str(log["content"])
-                
-                # Very simple pattern matching - could be replaced with regex
-                if condition.lower() in log_str.lower():
-                    self.terminate(condition, f"Detected in log: {log_str}")
-                    return
-            
-            # Check for loop condition
-            if condition == "agent seems stuck in a loop" and self._detect_loop():
-                self.terminate(condition)
+        # Only scan entries that arrived since the previous check
+        new_logs = self._drain_pending_logs()
+        
+        # Check all new log entries against all substring conditions in a
+        # single regex pass, joining them with a separator no condition contains
+        if self._terminate_re is not None and new_logs:
+            # Record where each entry starts so a match can be mapped back to
+            # its entry, even if the content itself contains the separator
+            starts = []
+            offset = 0
+            for log in new_logs:
+                starts.append(offset)
+                offset += len(log.content_lower) + len(LOG_SEPARATOR)
+            blob = LOG_SEPARATOR.join(log.content_lower for log in new_logs)
+            match = self._terminate_re.search(blob)
+            if match:
+                condition = self._terminate_groups[match.lastgroup]
+                index = bisect.bisect_right(starts, match.start()) - 1
+                log_str = new_logs[index].content_str
+                self.terminate(condition, f"Detected in log: {log_str}")
                 return
-            
-            # Check for action count
-            if condition.startswith("the number of actions is >"):
-                try:
-                    limit = int(condition.split(">")[1].strip())
-                    action_count = sum(1 for log in self._logs if log["role"] == "assistant")
-                    if action_count > limit:
-                        self.terminate(condition)
-                        return
-                except (ValueError, IndexError):
-                    pass
+        
+        # Check for loop condition
+        if self._check_loop and self._detect_loop():
+            self.terminate(LOOP_CONDITION)
+            return
+        
+        # Check for action count
+        if self._action_limit is not None and self._assistant_count > self._action_limit:
+            self.terminate(self._action_limit_cond)
     
     def _check_permission_conditions(self):
         """Check if any permission conditions are met using pattern matching."""
-        if not self._logs:
+        if not self._has_permission_conditions or not self._logs:
             return
         
         # Get only the most recent log entry
         last_log = self._logs[-1]
-        log_str = str(last_log["content"])
-        
-        for condition in self._conditions.get("ask_permission_if", []):
-            # Simple pattern matching
-            if condition.lower() in log_str.lower():
-                self.request_permission(condition)
-                return
+        match = self._permission_re.search(last_log.content_lower)
+        if match:
+            self.request_permission(self._permission_groups[match.lastgroup])
     
     def _detect_loop(self):
         """
@@ -67,16 +74,10 @@ class LocalMonitor(BaseMonitor):
         Detects if the last 3 actions are identical to the previous 3.
         This is a very simple heuristic and could be improved.
         """
-        if len(self._logs) < 6:
+        if len(self._recent_actions) < 6:
             return False
         
-        # Check for repeating patterns in the last few actions
-        actions = [log for log in self._logs[-6:] if log["role"] == "assistant"]
-        if len(actions) < 6:
-            return False
-        
-        # Check if last 3 actions are identical to previous 3
-        last_3 = [str(a["content"]) for a in actions[-3:]]
-        prev_3 = [str(a["content"]) for a in actions[-6:-3]]
-        
-        return last_3 == prev_3 
\ No newline at end of file
+        # Check if last 3 actions are identical to previous 3; contents were
+        # already stringified by log(), so this is a plain tuple comparison
+        actions = tuple(self._recent_actions)
+        return actions[:3] == actions[3:]
\ No newline at end of file
@@ -1,7 +1,50 @@
-from typing import Any, TypedDict
+import sys
+from dataclasses import dataclass
+from typing import Any, Optional
 
-class LogEntry(TypedDict):
-    """Type definition for log entries."""
+# Logged string contents shorter than this are interned
+MAX_INTERN_LENGTH = 4096
+
+@dataclass
+class LogEntry:
+    """
+    A single logged event.
+    
+    The string forms of the content are computed on first access, so entries
+    logged while monitoring is disabled never pay for stringifying.
+    """
+    __slots__ = ("role", "content", "timestamp_ns", "_content_str", "_content_lower")
+    
     role: str
     content: Any
-    timestamp: float 
\ No newline at end of file
+    timestamp_ns: int  # time.monotonic_ns() when logged
+    
+    def __post_init__(self):
+        self._content_str: Optional[str] = None
+        self._content_lower: Optional[str] = None
+    
+    @property
+    def content_str(self) -> str:
+        """str(content), computed once."""
+        if self._content_str is None:
+            content = self.content
+            # sys.intern() only accepts exact str, not subclasses such as str enums.
+            # Repeated contents (e.g. an agent stuck in a loop) then share one
+            # object, which also lets loop detection compare them by identity
+            if type(content) is str and len(content) < MAX_INTERN_LENGTH:
+                self._content_str = sys.intern(content)
+            else:
+                self._content_str = content if isinstance(content, str) else str(content)
+        return self._content_str
+    
+    @property
+    def content_lower(self) -> str:
+        """content_str.casefold(), for case-insensitive matching."""
+        if self._content_lower is None:
+            content_lower = self.content_str.casefold()
+            # Intern under the same rule as content_str, so repeated contents
+            # don't each carry their own casefolded copy
+            if type(self.content) is str and len(self.content) < MAX_INTERN_LENGTH:
+                content_lower = sys.intern(content_lower)
+            self._content_lower = content_lower
+        return self._content_lower